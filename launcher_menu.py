@@ -1,16 +1,23 @@
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Callable, List, Optional, Sequence, Tuple
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
 
 import pygame
+import pygame.freetype
 import sys
 
-from games.connect_four import ConnectFourGame
-from games.othello import OthelloGame
-from games.tic_tac_toe import TicTacToeGame
-from utils.assets import load_image
+from utils.assets import (
+    _load_image_cached,
+    font_height,
+    load_font,
+    prepare_image,
+    read_image,
+    render_text_cached,
+    render_text_to,
+)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameEntry:
     name: str
     factory: Optional[Callable[[], object]]
@@ -19,17 +26,39 @@ class GameEntry:
     subtitle: Optional[str] = None
 
 
-@dataclass
-class Button:
+class Button(NamedTuple):
     entry: GameEntry
     rect: pygame.Rect
     icon_surface: Optional[pygame.Surface]
+    surf_normal: Optional[pygame.Surface] = None
+    surf_hover: Optional[pygame.Surface] = None
+    surf_disabled: Optional[pygame.Surface] = None
+
+
+# Game modules are imported on first launch so the menu window opens
+# without loading every game up front.
+def _make_tictactoe() -> object:
+    from games.tic_tac_toe import TicTacToeGame
+
+    return TicTacToeGame()
+
+
+def _make_othello() -> object:
+    from games.othello import OthelloGame
+
+    return OthelloGame()
+
+
+def _make_connect_four() -> object:
+    from games.connect_four import ConnectFourGame
+
+    return ConnectFourGame()
 
 
 DEFAULT_GAMES: Tuple[GameEntry, ...] = (
-    GameEntry("Tic Tac Toe", TicTacToeGame, "icon_tictactoe.png"),
-    GameEntry("Othello", OthelloGame, "icon_othello.png"),
-    GameEntry("Connect Four", ConnectFourGame, "icon_connectfour.png"),
+    GameEntry("Tic Tac Toe", _make_tictactoe, "icon_tictactoe.png"),
+    GameEntry("Othello", _make_othello, "icon_othello.png"),
+    GameEntry("Connect Four", _make_connect_four, "icon_connectfour.png"),
     GameEntry("Game 4", None, enabled=False, subtitle="Coming Soon"),
     GameEntry("Game 5", None, enabled=False, subtitle="Coming Soon"),
 )
@@ -45,11 +74,21 @@ class GameLauncher:
     BUTTON_TOP = 320
     BUTTON_COLUMNS = 3
 
+    FRAME_MS = 1000 // 60
+    # Poll rate while neither keyboard nor mouse focus is on the window
+    IDLE_FRAME_MS = 1000 // 5
+
+    # The only events the launcher reacts to; everything else (notably the
+    # MOUSEMOTION flood, since hover is polled) is dropped at the SDL queue.
+    HANDLED_EVENTS = (pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+
     def __init__(self, games: Sequence[GameEntry] | None = None):
         pygame.init()
+        pygame.freetype.init()
 
         self.SCREEN = pygame.display.set_mode((self.WIDTH, self.HEIGHT))
         pygame.display.set_caption("FH Aachen Game Portal")
+        self._filter_events()
 
         # FH Aachen brand colors
         self.FH_TURQUOISE = (0, 166, 160)
@@ -62,161 +101,359 @@ class GameLauncher:
         self.DISABLED_COLOR = (140, 140, 140)
 
         # Fonts
-        self.FONT_TITLE = pygame.font.Font(None, 88)
-        self.FONT_SUBTITLE = pygame.font.Font(None, 42)
-        self.FONT_BUTTON = pygame.font.Font(None, 48)
-        self.FONT_SMALL = pygame.font.Font(None, 28)
-        self.FONT_COMING_SOON = pygame.font.Font(None, 26)
-        self.FONT_FOOTER = pygame.font.Font(None, 24)
+        self.FONT_TITLE = load_font(88)
+        self.FONT_SUBTITLE = load_font(42)
+        self.FONT_BUTTON = load_font(48)
+        self.FONT_SMALL = load_font(28)
+        self.FONT_COMING_SOON = load_font(26)
+        self.FONT_FOOTER = load_font(24)
 
         # Static text surfaces so we do not recreate them every frame
         self.TEXT_SURFACES = {
-            "title": self.FONT_TITLE.render("FH Aachen Game Portal", True, self.BLACK),
-            "subtitle": self.FONT_SUBTITLE.render("Robot Interactive Games", True, self.DARK_GRAY),
-            "instruction": self.FONT_SMALL.render("Select a game to play with the robot", True, self.DARK_GRAY),
-            "coming_soon": self.FONT_COMING_SOON.render("Coming Soon", True, self.LIGHT_GRAY),
-            "footer": self.FONT_FOOTER.render("Powered by FH Aachen @2025", True, self.DARK_GRAY),
+            "title": render_text_cached(id(self.FONT_TITLE), "FH Aachen Game Portal", self.BLACK),
+            "subtitle": render_text_cached(id(self.FONT_SUBTITLE), "Robot Interactive Games", self.DARK_GRAY),
+            "instruction": render_text_cached(
+                id(self.FONT_SMALL), "Select a game to play with the robot", self.DARK_GRAY
+            ),
+            "coming_soon": render_text_cached(id(self.FONT_COMING_SOON), "Coming Soon", self.LIGHT_GRAY),
+            "footer": render_text_cached(id(self.FONT_FOOTER), "Powered by FH Aachen @2025", self.DARK_GRAY),
         }
 
         self.games: Sequence[GameEntry] = games if games is not None else DEFAULT_GAMES
+
+        # Grid geometry for the O(1) hover/click hit-test
+        self._col_pitch = self.BUTTON_WIDTH + self.BUTTON_SPACING_X
+        self._row_pitch = self.BUTTON_HEIGHT + self.BUTTON_SPACING_Y
+        self._n_rows = -(-len(self.games) // self.BUTTON_COLUMNS)
+        self._row_start_x: Tuple[int, ...] = self._compute_row_starts()
+
+        self._state_surfaces: Dict[Tuple[int, int, bool, bool], pygame.Surface] = {}
         self.buttons: List[Button] = self._build_buttons()
         self.logo = self._load_logo()
+        self._background = self._build_background()
 
-        self.clock = pygame.time.Clock()
         self.hovered_button: Optional[int] = None
 
+        # Only repaint what changed: a full frame on start-up/display reset,
+        # otherwise just the buttons whose hover state flipped.
+        self._dirty: List[pygame.Rect] = []
+        self._needs_full_redraw = True
+
+    def _build_background(self) -> pygame.Surface:
+        """Bake the static parts of the menu (fill, header texts, logo, footer) into one surface."""
+        background = pygame.Surface((self.WIDTH, self.HEIGHT)).convert()
+        background.fill(self.FH_TURQUOISE)
+
+        text_surfaces = self.TEXT_SURFACES
+        blits = [
+            (text_surfaces[key], text_surfaces[key].get_rect(center=(self.WIDTH // 2, y)))
+            for key, y in (("title", 120), ("subtitle", 200), ("instruction", 250))
+        ]
+        if self.logo:
+            blits.append((self.logo, (self.WIDTH - 430, self.HEIGHT - 170)))
+        blits.append((text_surfaces["footer"], (30, self.HEIGHT - 40)))
+
+        background.blits(blits, doreturn=0)
+        return background
+
     def _load_logo(self) -> Optional[pygame.Surface]:
         try:
-            return load_image("logo.jpg", size=(400, 150), convert_alpha=False)
+            return _load_image_cached("logo.jpg", size=(400, 150), convert_alpha=False)
         except Exception as exc:
             print(f"Could not load logo: {exc}")
             return None
 
-    def _compute_button_position(self, index: int) -> Tuple[int, int]:
-        row = index // self.BUTTON_COLUMNS
-        col = index % self.BUTTON_COLUMNS
+    def _compute_row_starts(self) -> Tuple[int, ...]:
+        """Left edge of every (centered) button row."""
+        starts = []
+        for row in range(self._n_rows):
+            buttons_remaining = len(self.games) - row * self.BUTTON_COLUMNS
+            buttons_in_row = min(self.BUTTON_COLUMNS, buttons_remaining)
 
-        buttons_remaining = len(self.games) - row * self.BUTTON_COLUMNS
-        buttons_in_row = min(self.BUTTON_COLUMNS, buttons_remaining)
+            row_width = (
+                buttons_in_row * self.BUTTON_WIDTH
+                + max(0, buttons_in_row - 1) * self.BUTTON_SPACING_X
+            )
+            starts.append((self.WIDTH - row_width) // 2)
+        return tuple(starts)
 
-        row_width = (
-            buttons_in_row * self.BUTTON_WIDTH
-            + max(0, buttons_in_row - 1) * self.BUTTON_SPACING_X
+    def _build_buttons(self) -> List[Button]:
+        # The layout is static: compute every rect (and its shadow-inclusive
+        # area) in one pass over rows and columns.
+        rects: List[pygame.Rect] = []
+        for row, row_start_x in enumerate(self._row_start_x):
+            y = self.BUTTON_TOP + row * self._row_pitch
+            buttons_in_row = min(self.BUTTON_COLUMNS, len(self.games) - row * self.BUTTON_COLUMNS)
+            for col in range(buttons_in_row):
+                x = row_start_x + col * self._col_pitch
+                rects.append(pygame.Rect(x, y, self.BUTTON_WIDTH, self.BUTTON_HEIGHT))
+        self._button_rects: Tuple[pygame.Rect, ...] = tuple(rects)
+        self._button_areas: Tuple[pygame.Rect, ...] = tuple(
+            pygame.Rect(rect.x, rect.y, rect.width + 6, rect.height + 6) for rect in rects
         )
-        row_start_x = (self.WIDTH - row_width) // 2
 
-        x = row_start_x + col * (self.BUTTON_WIDTH + self.BUTTON_SPACING_X)
-        y = self.BUTTON_TOP + row * (self.BUTTON_HEIGHT + self.BUTTON_SPACING_Y)
-        return x, y
+        # Decode the icons in parallel; conversion and scaling stay on this
+        # (display) thread in prepare_image.
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            icon_futures: Dict[int, Future] = {
+                idx: executor.submit(read_image, entry.icon)
+                for idx, entry in enumerate(self.games)
+                if entry.icon
+            }
 
-    def _build_buttons(self) -> List[Button]:
         buttons: List[Button] = []
-        for idx, entry in enumerate(self.games):
-            x, y = self._compute_button_position(idx)
-            rect = pygame.Rect(x, y, self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
-
+        for idx, (entry, rect) in enumerate(zip(self.games, self._button_rects)):
             icon_surface = None
-            if entry.icon:
+            if idx in icon_futures:
                 try:
-                    icon_surface = load_image(entry.icon, size=(80, 80))
+                    icon_surface = prepare_image(icon_futures[idx].result(), size=(80, 80))
                 except Exception as exc:
                     print(f"Could not load icon for {entry.name}: {exc}")
 
-            buttons.append(Button(entry=entry, rect=rect, icon_surface=icon_surface))
+            if entry.enabled:
+                surf_normal = self._render_button_surface(entry, icon_surface, hovered=False)
+                surf_hover = self._render_button_surface(entry, icon_surface, hovered=True)
+                surf_disabled = None
+            else:
+                surf_disabled = self._render_button_surface(entry, icon_surface, hovered=False)
+                surf_normal = surf_hover = surf_disabled
+            buttons.append(Button(entry, rect, icon_surface, surf_normal, surf_hover, surf_disabled))
         return buttons
 
+    def _render_button_surface(
+        self,
+        entry: GameEntry,
+        icon_surface: Optional[pygame.Surface],
+        hovered: bool,
+    ) -> pygame.Surface:
+        """Pre-render one button state (shadow, body, icon and labels) so draw_ui only blits it."""
+        rect = pygame.Rect(0, 0, self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
+        surface = self._state_surface(rect.width, rect.height, entry.enabled, hovered).copy()
+
+        text_color = self.WHITE if entry.enabled else self.LIGHT_GRAY
+        label_height = font_height(self.FONT_BUTTON)
+
+        text_x_offset = 30
+        if icon_surface:
+            surface.blit(icon_surface, (30, rect.centery - 40))
+            text_x_offset = 130
+
+        # Labels are drawn straight onto the button surface, no temporary text surface
+        text_y = rect.centery - label_height // 2
+        render_text_to(surface, self.FONT_BUTTON, (text_x_offset, text_y), entry.name, text_color)
+
+        if not entry.enabled and entry.subtitle:
+            subtitle_pos = (text_x_offset, text_y + label_height)
+            render_text_to(surface, self.FONT_COMING_SOON, subtitle_pos, entry.subtitle, self.LIGHT_GRAY)
+
+        return surface.convert_alpha()
+
+    def _state_surface(self, width: int, height: int, enabled: bool, hovered: bool) -> pygame.Surface:
+        """Shadow + rounded body (+ hover border), rasterized once per size and state."""
+        key = (width, height, enabled, hovered)
+        surface = self._state_surfaces.get(key)
+        if surface is not None:
+            return surface
+
+        surface = pygame.Surface((width + 6, height + 6), pygame.SRCALPHA)
+        rect = pygame.Rect(0, 0, width, height)
+
+        shadow_rect = rect.move(6, 6)
+        pygame.draw.rect(surface, self.DARK_GRAY, shadow_rect, border_radius=15)
+
+        color = self.BUTTON_COLOR if enabled else self.DISABLED_COLOR
+        if enabled and hovered:
+            color = self.BUTTON_HOVER
+
+        pygame.draw.rect(surface, color, rect, border_radius=15)
+
+        if enabled and hovered:
+            pygame.draw.rect(surface, self.WHITE, rect, width=4, border_radius=15)
+
+        surface = surface.convert_alpha()
+        self._state_surfaces[key] = surface
+        return surface
+
     def _reset_display(self) -> None:
         """Re-create the launcher window after closing a mini game."""
         self.SCREEN = pygame.display.set_mode((self.WIDTH, self.HEIGHT))
         pygame.display.set_caption("FH Aachen Game Portal")
+        self._filter_events()
+        self._reconvert_surfaces()
+        self._needs_full_redraw = True
+
+    def _reconvert_surfaces(self) -> None:
+        """Match cached images to the new display's pixel format so blits stay on the fast path."""
+        self.TEXT_SURFACES = {key: surface.convert_alpha() for key, surface in self.TEXT_SURFACES.items()}
+        if self.logo:
+            self.logo = self.logo.convert()
+        self._background = self._background.convert()
+        self.buttons = [self._reconvert_button(button) for button in self.buttons]
+
+    @staticmethod
+    def _reconvert_button(button: Button) -> Button:
+        icon_surface = button.icon_surface.convert_alpha() if button.icon_surface else None
+        if button.entry.enabled:
+            return button._replace(
+                icon_surface=icon_surface,
+                surf_normal=button.surf_normal.convert_alpha(),
+                surf_hover=button.surf_hover.convert_alpha(),
+            )
+        surf_disabled = button.surf_disabled.convert_alpha()
+        return button._replace(
+            icon_surface=icon_surface,
+            surf_normal=surf_disabled,
+            surf_hover=surf_disabled,
+            surf_disabled=surf_disabled,
+        )
+
+    def _filter_events(self) -> None:
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(list(self.HANDLED_EVENTS))
+
+    def _button_area(self, index: int) -> pygame.Rect:
+        """Screen area covered by a button including its drop shadow."""
+        return self._button_areas[index]
+
+    def _set_hovered_button(self, index: Optional[int]) -> None:
+        if index == self.hovered_button:
+            return
+        for changed in (self.hovered_button, index):
+            if changed is not None:
+                self._dirty.append(self._button_area(changed))
+        self.hovered_button = index
 
     def _launch_game(self, entry: GameEntry) -> None:
         if not entry.enabled or entry.factory is None:
             return
 
         print(f"Starting {entry.name}...")
+        # Mini games run their own event loop; give them the full event stream.
+        pygame.event.set_allowed(None)
         game_instance = entry.factory()
         game_instance.run_game()
         self._reset_display()
 
-    def _handle_click(self, position: Tuple[int, int]) -> None:
-        for idx, button in enumerate(self.buttons):
-            if button.rect.collidepoint(position) and button.entry.enabled:
-                self._launch_game(button.entry)
-                self.hovered_button = idx
-                break
-
-    def draw_ui(self) -> None:
-        self.SCREEN.fill(self.FH_TURQUOISE)
-
-        title_rect = self.TEXT_SURFACES["title"].get_rect(center=(self.WIDTH // 2, 120))
-        subtitle_rect = self.TEXT_SURFACES["subtitle"].get_rect(center=(self.WIDTH // 2, 200))
-        instruction_rect = self.TEXT_SURFACES["instruction"].get_rect(center=(self.WIDTH // 2, 250))
-
-        self.SCREEN.blit(self.TEXT_SURFACES["title"], title_rect)
-        self.SCREEN.blit(self.TEXT_SURFACES["subtitle"], subtitle_rect)
-        self.SCREEN.blit(self.TEXT_SURFACES["instruction"], instruction_rect)
+    def _hit_test(self, position: Tuple[int, int]) -> Optional[int]:
+        """Map a screen position to the index of an enabled button via the grid layout."""
+        x, y = position
+        offset_y = y - self.BUTTON_TOP
+        if offset_y < 0:
+            return None
+        row = offset_y // self._row_pitch
+        if row >= self._n_rows or offset_y - row * self._row_pitch >= self.BUTTON_HEIGHT:
+            return None
 
-        for idx, button in enumerate(self.buttons):
-            rect = button.rect
-            entry = button.entry
-            is_hovered = self.hovered_button == idx
+        offset_x = x - self._row_start_x[row]
+        if offset_x < 0:
+            return None
+        col = offset_x // self._col_pitch
+        if col >= self.BUTTON_COLUMNS or offset_x - col * self._col_pitch >= self.BUTTON_WIDTH:
+            return None
 
-            shadow_rect = pygame.Rect(rect.x + 6, rect.y + 6, rect.width, rect.height)
-            pygame.draw.rect(self.SCREEN, self.DARK_GRAY, shadow_rect, border_radius=15)
+        index = row * self.BUTTON_COLUMNS + col
+        if index >= len(self.buttons) or not self.buttons[index].entry.enabled:
+            return None
+        return index
 
-            color = self.BUTTON_COLOR if entry.enabled else self.DISABLED_COLOR
-            if entry.enabled and is_hovered:
-                color = self.BUTTON_HOVER
+    def _handle_click(self, position: Tuple[int, int]) -> None:
+        idx = self._hit_test(position)
+        if idx is not None:
+            self._launch_game(self.buttons[idx].entry)
+            self._set_hovered_button(idx)
 
-            pygame.draw.rect(self.SCREEN, color, rect, border_radius=15)
+    def draw_ui(self) -> None:
+        dirty_area = sum(rect.width * rect.height for rect in self._dirty)
+        if not self._needs_full_redraw and dirty_area < self.WIDTH * self.HEIGHT:
+            self._draw_dirty_buttons()
+            return
 
-            if entry.enabled and is_hovered:
-                pygame.draw.rect(self.SCREEN, self.WHITE, rect, width=4, border_radius=15)
+        hovered_button = self.hovered_button
 
-            text_color = self.WHITE if entry.enabled else self.LIGHT_GRAY
-            label_surface = self.FONT_BUTTON.render(entry.name, True, text_color)
+        # Static background first, then the buttons, in one batched call
+        blits = [(self._background, (0, 0))]
+        blits.extend(
+            (button.surf_hover if hovered_button == idx else button.surf_normal, rect.topleft)
+            for idx, (button, rect) in enumerate(zip(self.buttons, self._button_rects))
+        )
+        self.SCREEN.blits(blits, doreturn=0)
 
-            text_x_offset = 30
-            if button.icon_surface:
-                icon_pos = (rect.x + 30, rect.centery - 40)
-                self.SCREEN.blit(button.icon_surface, icon_pos)
-                text_x_offset = 130
+        pygame.display.flip()
+        self._needs_full_redraw = False
+        self._dirty.clear()
 
-            text_x = rect.x + text_x_offset
-            text_y = rect.centery - label_surface.get_height() // 2
-            self.SCREEN.blit(label_surface, (text_x, text_y))
+    def _draw_dirty_buttons(self) -> None:
+        """Repaint only the buttons touched by a hover change and push those rects."""
+        dirty = self._dirty
+        if not dirty:
+            return
 
-            if not entry.enabled and entry.subtitle:
-                subtitle_surface = self.FONT_COMING_SOON.render(entry.subtitle, True, self.LIGHT_GRAY)
-                subtitle_y = text_y + label_surface.get_height()
-                self.SCREEN.blit(subtitle_surface, (text_x, subtitle_y))
+        screen = self.SCREEN
+        background = self._background
+        hovered_button = self.hovered_button
+        buttons = self.buttons
+        areas = self._button_areas
 
-        if self.logo:
-            self.SCREEN.blit(self.logo, (self.WIDTH - 430, self.HEIGHT - 170))
+        # Let collidelistall scan the button areas in C rather than looping in Python
+        touched = set()
+        for rect in dirty:
+            touched.update(rect.collidelistall(areas))
 
-        footer_pos = (30, self.HEIGHT - 40)
-        self.SCREEN.blit(self.TEXT_SURFACES["footer"], footer_pos)
+        for idx in touched:
+            area = areas[idx]
+            button = buttons[idx]
+            screen.blit(background, area, area)
+            surface = button.surf_hover if hovered_button == idx else button.surf_normal
+            screen.blit(surface, area.topleft)
 
-        pygame.display.flip()
+        pygame.display.update(dirty)
+        dirty.clear()
 
     def run(self) -> None:
+        # Hoist the lookups the loop repeats every frame into locals
+        get_pos = pygame.mouse.get_pos
+        event_get = pygame.event.get
+        get_ticks = pygame.time.get_ticks
+        wait = pygame.time.wait
+        frame_ms = self.FRAME_MS
+        idle_frame_ms = self.IDLE_FRAME_MS
+        key_focused = pygame.key.get_focused
+        mouse_focused = pygame.mouse.get_focused
+        hit_test = self._hit_test
+        set_hovered_button = self._set_hovered_button
+        handled_events = self.HANDLED_EVENTS
+        expose_events = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+        dirty = self._dirty
+
+        next_frame_ms = get_ticks() + frame_ms
         running = True
         while running:
-            mouse_pos = pygame.mouse.get_pos()
-            self.hovered_button = None
-            for idx, button in enumerate(self.buttons):
-                if button.rect.collidepoint(mouse_pos) and button.entry.enabled:
-                    self.hovered_button = idx
-                    break
+            # In the background there is no hover to track; only expose events
+            # (full redraw) and clicks still need handling, at a low rate.
+            active = key_focused() or mouse_focused()
+            if active:
+                set_hovered_button(hit_test(get_pos()))
 
-            self.draw_ui()
+            if self._needs_full_redraw or dirty:
+                self.draw_ui()
 
-            for event in pygame.event.get():
+            for event in event_get(handled_events):
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
                 if event.type == pygame.MOUSEBUTTONDOWN:
                     self._handle_click(event.pos)
-
-            self.clock.tick(60)
+                if event.type in expose_events:
+                    self._needs_full_redraw = True
+
+            # Sleep away the rest of the frame slot instead of spinning; idle
+            # frames do nothing but poll, so this is where the loop spends its time.
+            now = get_ticks()
+            remaining = next_frame_ms - now
+            if remaining > 2:
+                wait(remaining - 1)
+            budget_ms = frame_ms if active else idle_frame_ms
+            next_frame_ms += budget_ms
+            if next_frame_ms < now:
+                # Fell behind (e.g. a mini game just ran): resync rather than catch up.
+                next_frame_ms = now + budget_ms
@@ -1,12 +1,22 @@
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 import pygame
+import pygame.freetype
 
 # Absolute path to the repository root (one level above this utils package)
 BASE_DIR = Path(__file__).resolve().parents[1]
 ASSETS_DIR = BASE_DIR / "assets"
 
+# Fonts known to render_text_cached, keyed by id(font). Holding a reference
+# here keeps the id stable for as long as the cache may refer to it.
+_FONT_BY_ID: Dict[int, pygame.freetype.Font] = {}
+
+# pygame.font renders its bundled default font at 0.6875 of the requested
+# size; load_font applies the same factor so sizes carry over unchanged.
+_DEFAULT_FONT_SCALE = 0.6875
+
 
 def resource_path(*parts: str) -> Path:
     """
@@ -16,6 +26,36 @@ def resource_path(*parts: str) -> Path:
     return BASE_DIR.joinpath(*parts)
 
 
+def read_image(relative_path: str) -> pygame.Surface:
+    """
+    Reads and decodes an image from the assets folder without converting it.
+    Safe to call from worker threads; pass the result to prepare_image on
+    the display thread.
+    """
+    return pygame.image.load(str(ASSETS_DIR / relative_path))
+
+
+def prepare_image(
+    image: pygame.Surface,
+    *,
+    size: Optional[Tuple[int, int]] = None,
+    convert_alpha: bool = True,
+) -> pygame.Surface:
+    """
+    Applies the correct conversion for fast blitting and optionally scales
+    the image. Opaque images use the cheaper nearest-neighbour scale, and
+    images already at the target size are not rescaled at all.
+    """
+    image = image.convert_alpha() if convert_alpha else image.convert()
+
+    if size is not None and image.get_size() != tuple(size):
+        if convert_alpha:
+            image = pygame.transform.smoothscale(image, size)
+        else:
+            image = pygame.transform.scale(image, size)
+    return image
+
+
 def load_image(
     relative_path: str,
     *,
@@ -26,13 +66,89 @@ def load_image(
     Loads an image from the assets folder, optionally scales it and applies
     the correct conversion for fast blitting.
     """
-    image_path = ASSETS_DIR / relative_path
-    image = pygame.image.load(str(image_path))
-    image = image.convert_alpha() if convert_alpha else image.convert()
+    return prepare_image(read_image(relative_path), size=size, convert_alpha=convert_alpha)
 
-    if size is not None:
-        image = pygame.transform.smoothscale(image, size)
-    return image
+
+@lru_cache(maxsize=64)
+def _load_image_cached(
+    relative_path: str,
+    size: Optional[Tuple[int, int]] = None,
+    convert_alpha: bool = True,
+) -> pygame.Surface:
+    """
+    Memoized load_image for assets that are requested repeatedly (e.g. when
+    the launcher rebuilds its window). The surface is shared; do not modify it.
+    """
+    return load_image(relative_path, size=size, convert_alpha=convert_alpha)
+
+
+def register_font(font: pygame.freetype.Font) -> pygame.freetype.Font:
+    """
+    Makes a font available to render_text_cached under id(font) and returns
+    it unchanged, so it can wrap the font constructor call.
+    """
+    _FONT_BY_ID[id(font)] = font
+    return font
+
+
+def load_font(size: int) -> pygame.freetype.Font:
+    """
+    Creates and registers a freetype font using pygame's bundled default
+    face. The font works in origin mode, i.e. render_to positions text by
+    its baseline; use render_text_to for top-left placement.
+    """
+    font = pygame.freetype.Font(None, max(1, int(size * _DEFAULT_FONT_SCALE)))
+    font.origin = True
+    return register_font(font)
+
+
+def font_height(font: pygame.freetype.Font) -> int:
+    """Line height of the font, matching pygame.font.Font.get_height()."""
+    return font.get_sized_ascender() - font.get_sized_descender()
+
+
+def render_text_to(
+    surface: pygame.Surface,
+    font: pygame.freetype.Font,
+    dest: Tuple[int, int],
+    text: str,
+    color: Tuple[int, ...],
+) -> None:
+    """
+    Draws text straight onto surface with the top of its line box at dest,
+    without allocating an intermediate text surface.
+    """
+    x, y = dest
+    font.render_to(surface, (x, y + font.get_sized_ascender()), text, fgcolor=color)
+
+
+@lru_cache(maxsize=512)
+def render_text_cached(
+    font_id: int,
+    text: str,
+    color: Tuple[int, ...],
+) -> pygame.Surface:
+    """
+    Renders text with a registered font and memoizes the converted surface.
+    The returned surface is shared between callers and must not be modified.
+    """
+    font = _FONT_BY_ID[font_id]
+    width = max(1, font.get_rect(text).right)
+    surface = pygame.Surface((width, font_height(font)), pygame.SRCALPHA)
+    render_text_to(surface, font, (0, 0), text, color)
+    return surface.convert_alpha()
 
 
-__all__ = ["ASSETS_DIR", "BASE_DIR", "load_image", "resource_path"]
+__all__ = [
+    "ASSETS_DIR",
+    "BASE_DIR",
+    "font_height",
+    "load_font",
+    "load_image",
+    "prepare_image",
+    "read_image",
+    "register_font",
+    "render_text_cached",
+    "render_text_to",
+    "resource_path",
+]